@@ -68,20 +68,25 @@ def bloom_check(args):
         bloom = BloomFilter.load(bloom_path)
         
         results = {}
-        
-        # Process input files
+
+        # Read the input files, then check them as one batch so the
+        # filter is probed in a single vectorized pass.
+        readable = []
         for input_file in args.input_files:
             input_path = Path(input_file)
-            
+
             if not input_path.exists():
                 logger.warning(f"Input file does not exist: {input_path}")
                 results[str(input_path)] = "FILE_NOT_FOUND"
                 continue
-            
+
             logger.info(f"Checking {input_path}")
-            result = bloom.check_file(input_path)
+            readable.append((input_path, input_path.read_bytes()))
+
+        verdicts = bloom.check_many([data for _, data in readable])
+        for (input_path, _), result in zip(readable, verdicts):
             results[str(input_path)] = result
-            
+
             # Print result to stdout
             print(f"{input_path}: {result}")
         
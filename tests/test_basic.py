@@ -103,6 +103,48 @@ def test_save_and_load():
         assert bloom2.metadata["false_positive_rate"] == 0.1
 
 
+def test_repetitive_text():
+    """Repetitive text dedupes to few digests but must still be found."""
+    bloom = BloomFilter(expected_items=1000, false_positive_rate=0.1, chunk_size=32, consecutive_chunks=3)
+
+    # Every overlapping window of these inputs hashes identically, so
+    # the whole text collapses to a single probed digest.
+    repetitive = "x" * 200
+    bloom.add(repetitive)
+    assert bloom.check(repetitive) == "MAYBE_PRESENT"
+
+    padded = "a" * 2048
+    bloom.add(padded)
+    assert bloom.check(padded) == "MAYBE_PRESENT"
+
+    # Repetitive text that was never added stays NOT_PRESENT
+    assert bloom.check("z" * 2048) == "NOT_PRESENT"
+
+    # Batched API agrees
+    assert bloom.check_many([repetitive, padded, "z" * 2048]) == [
+        "MAYBE_PRESENT", "MAYBE_PRESENT", "NOT_PRESENT"]
+
+
+def test_check_many():
+    """Test batched checking of multiple texts."""
+    bloom = BloomFilter(expected_items=1000, false_positive_rate=0.1, chunk_size=32, consecutive_chunks=2)
+
+    added_text = "This is a test document with some content. " * 10
+    bloom.add(added_text)
+
+    other_text = "This is completely different content that was never added before and should not be found." * 5
+
+    results = bloom.check_many([added_text, other_text, added_text])
+    assert results == ["MAYBE_PRESENT", "NOT_PRESENT", "MAYBE_PRESENT"]
+
+    # Batched results match the single-text API
+    assert results[0] == bloom.check(added_text)
+    assert results[1] == bloom.check(other_text)
+
+    # Empty batch is a no-op
+    assert bloom.check_many([]) == []
+
+
 def test_cli_import():
     """Test that CLI module can be imported."""
     from aegis.cli import main